@@ -0,0 +1,19 @@
+from cbdb_common.client import lifespan, search_places_under_location
+from cbdb_common.people import query_people_by_place
+from cbdb_common.runner import run_server
+from cbdb_common.tgaz import get_place_details, get_place_details_bulk, search_historical_places
+from mcp.server.fastmcp import FastMCP
+
+# Serves the tools of the cbdb_addr, cbdb_addr_person and chgis servers from a
+# single process, so that all of them share one HTTP client and its connections.
+mcp = FastMCP("cbdb_chgis", lifespan=lifespan)
+
+mcp.tool()(search_places_under_location)
+mcp.tool()(query_people_by_place)
+mcp.tool()(search_historical_places)
+mcp.tool()(get_place_details)
+mcp.tool()(get_place_details_bulk)
+
+if __name__ == "__main__":
+    # Initialize and run the server
+    run_server(mcp)
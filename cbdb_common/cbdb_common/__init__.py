@@ -0,0 +1 @@
+"""Shared HTTP client and tools used by the CBDB and CHGIS MCP servers."""
@@ -0,0 +1,129 @@
+import asyncio
+import httpx
+import orjson
+from contextlib import asynccontextmanager
+from mcp.server.fastmcp import FastMCP
+from tenacity import retry, retry_if_exception_type, retry_if_result, stop_after_attempt, wait_exponential_jitter
+
+_client: httpx.AsyncClient | None = None
+
+# Requests currently in flight, keyed by URL, query parameters and headers
+_inflight: dict[tuple, asyncio.Task] = {}
+
+def shared_client() -> httpx.AsyncClient:
+    """
+    Returns the HTTP client shared by all tools, creating it on first use.
+
+    Keeping a single client means connections (and their TLS sessions) are kept
+    alive and reused across tool calls, and HTTP/2 lets concurrent tool calls
+    share one connection to the CBDB host. TGAZ is served over plain http and
+    always uses HTTP/1.1.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        # Idle connections are kept for a minute so that bursts of tool calls
+        # reuse them. Retries are left to get_with_retry, not the transport.
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=60.0),
+                retries=0,
+            ),
+        )
+    return _client
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Closes the shared HTTP client when the server shuts down."""
+    try:
+        yield
+    finally:
+        if _client is not None:
+            await _client.aclose()
+
+def _is_server_error(response: httpx.Response) -> bool:
+    return response.status_code >= 500
+
+# Transient failures (connection errors, timeouts and 5xx responses) are retried
+# with jittered exponential backoff. Once the attempts are exhausted the last
+# response is returned, or the last exception is raised, as if not retried.
+@retry(
+    retry=retry_if_exception_type(httpx.TransportError) | retry_if_result(_is_server_error),
+    wait=wait_exponential_jitter(initial=0.2, max=2.0),
+    stop=stop_after_attempt(4),
+    retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+)
+async def _get_with_retry(url: str, params: dict | None = None, headers: dict | None = None) -> httpx.Response:
+    return await shared_client().get(url, params=params, headers=headers)
+
+async def get_with_retry(url: str, params: dict | None = None, headers: dict | None = None) -> httpx.Response:
+    """
+    Sends a GET request through the shared client, retrying transient failures.
+
+    Concurrent calls for the same URL, parameters and headers share a single
+    request and all receive its response.
+    """
+    key = (
+        url,
+        tuple(sorted(params.items())) if params else None,
+        tuple(sorted(headers.items())) if headers else None,
+    )
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_get_with_retry(url, params, headers))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so that a cancelled caller does not cancel the request for the others
+    return await asyncio.shield(task)
+
+async def search_places_under_location(name: str, accurate: int = 1, startTime: int = None, endTime: int = None, start: int = 1, list_length: int = 10) -> dict:
+    """
+    Searches for all locations belonging to a specific parent location ID in the CBDB database.
+
+    Retrieves a paginated list of sub-locations for a given parent location ID.
+
+    Args:
+        name (str): The location name to search for. Must be provided in English or Chinese.
+        accurate (int): Matching mode — 0 for exact match, 1 for fuzzy match. Defaults to 1 (fuzzy).
+        startTime (int, optional): Start time filter for location lifespan.
+        endTime (int, optional): End time filter for location lifespan.
+        start (int): Pagination start index (starting record). Defaults to 1.
+        list_length (int): Number of results per page. Defaults to 10.
+
+    Returns:
+        dict: A dictionary with keys:
+            - total: Total record count
+            - start: Starting index of current results
+            - end: Ending index of current results
+            - data: List of location dictionaries with pId, pName, pNameChn, etc.
+
+    Example Usage:
+        To search for locations named "廣州市" (fuzzy match):
+        search_location_by_name(name="廣州市", accurate=1)
+    """
+    api_url = "https://input.cbdb.fas.harvard.edu/api/place_list"
+    # Build the parameters in one pass, leaving out optional filters that were not provided
+    params = {
+        key: value
+        for key, value in (
+            ("name", name),
+            ("accurate", accurate),
+            ("start", start),
+            ("list", list_length),
+            ("startTime", startTime),
+            ("endTime", endTime),
+        )
+        if value is not None
+    }
+
+    try:
+        response = await get_with_retry(api_url, params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    except httpx.RequestError as exc:
+        return {"error": f"API request failed: {exc}"}
+    except httpx.HTTPStatusError as exc:
+        return {"error": "http_error", "status": exc.response.status_code, "body": exc.response.text[:500]}
+    except Exception as e:
+        return {"error": f"An unexpected error occurred: {e}"}
@@ -0,0 +1,90 @@
+import httpx
+import orjson
+from cbdb_common.client import get_with_retry
+
+async def query_people_by_place(
+    people_place: list[int], 
+    place_type: list[str], 
+    use_date: int = 0,
+    date_type: str = None,
+    date_start_time: int = None,
+    date_end_time: int = None,
+    dyn_start: int = None,
+    dyn_end: int = None,
+    use_xy: int = 0,
+    start: int = 1, 
+    list_length: int = 50
+) -> dict:
+    """
+    Searches for people associated with specific locations and place types in the CBDB database.
+
+    Args:
+        people_place (list[int]): List of location IDs to search for.
+        place_type (list[str]): List of place types to filter by. Options include:
+            - "individual" (for person's origin/籍贯)
+            - "entry" (for entry into service/入仕)
+            - "officePosting" (for official positions/职官)
+        use_date (int): Whether to use date filtering. 1 for yes, 0 for no. Defaults to 0.
+        date_type (str, optional): The type of date to filter by ("dynasty" or "year"). Default is None.
+        date_start_time (int, optional): Start year for filtering. Default is None.
+        date_end_time (int, optional): End year for filtering. Default is None.
+        dyn_start (int, optional): Start dynasty code for filtering. Default is None.
+        dyn_end (int, optional): End dynasty code for filtering. Default is None.
+        use_xy (int): Whether to include geographic coordinates. 1 for yes, 0 for no. Defaults to 0.
+        start (int): Pagination start index. Defaults to 1.
+        list_length (int): Number of results per page. Defaults to 10.
+
+    Returns:
+        dict: A dictionary with keys:
+            - total: Total record count
+            - start: Starting index of current results
+            - end: Ending index of current results
+            - data: List of people dictionaries with PersonID, Name, NameChn, PlaceType, etc.
+
+    Example Usage:
+        To search for people associated with locations 2928, 10522, etc., with place types "individual" and "entry":
+        query_people_by_place(
+            people_place=[2928, 10522, 12553, 13947, 13949], 
+            place_type=["individual", "entry", "officePosting"],
+            use_date=1,
+            date_type="dynasty",
+            dyn_start=17, 
+            dyn_end=22
+        )
+    """
+    api_url = "https://input.cbdb.fas.harvard.edu/api/query_place"
+    
+    # Construct the request payload with all parameters
+    payload = {
+        "peoplePlace": people_place,
+        "placeType": place_type,
+        "useDate": use_date,
+        "dateType": date_type,
+        "dateStartTime": date_start_time,
+        "dateEndTime": date_end_time,
+        "dynStart": dyn_start,
+        "dynEnd": dyn_end,
+        "useXy": use_xy,
+        "start": start,
+        "list": list_length
+    }
+    
+    # Leave out unset parameters and convert the payload to a compact JSON string
+    payload = {k: v for k, v in payload.items() if v is not None}
+    request_payload = orjson.dumps(payload).decode()
+    
+    # Separate calls are deliberately not merged into one multi-place request:
+    # the API pages over the combined result (start/list), so each caller's own
+    # total and page could not be recovered from it. Identical concurrent calls
+    # are still coalesced into one request by get_with_retry.
+    try:
+        # Use the GET method with the RequestPayload as a query parameter
+        response = await get_with_retry(api_url, params={"RequestPayload": request_payload})
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    except httpx.RequestError as exc:
+        return {"error": f"API request failed: {exc}"}
+    except httpx.HTTPStatusError as exc:
+        return {"error": "http_error", "status": exc.response.status_code, "body": exc.response.text[:500]}
+    except Exception as e:
+        return {"error": f"An unexpected error occurred: {e}"}
@@ -0,0 +1,12 @@
+import anyio
+from importlib.util import find_spec
+from mcp.server.fastmcp import FastMCP
+
+def run_server(mcp: FastMCP) -> None:
+    """
+    Runs an MCP server over stdio.
+
+    The server runs on uvloop's faster event loop where uvloop is installed
+    (it is not available on Windows), and on the default asyncio loop otherwise.
+    """
+    anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": find_spec("uvloop") is not None})
@@ -0,0 +1,265 @@
+import asyncio
+import httpx
+import orjson
+import sqlite3
+from async_lru import alru_cache
+from contextlib import closing
+from cbdb_common.client import get_with_retry
+from pathlib import Path
+
+# Place detail records are also kept on disk together with their ETag and
+# Last-Modified validators, so that after a restart a record is revalidated
+# with a conditional GET (304 Not Modified carries no body) instead of being
+# downloaded again. The store is shared by every server process and is only a
+# cache: it is accessed off the event loop, and any error (including a lock
+# held by another process) is treated as a miss rather than failing the lookup.
+_DETAILS_DB_PATH = Path.home() / ".cache" / "chgis" / "place_details.sqlite3"
+
+def _details_db_connection() -> sqlite3.Connection:
+    """Opens the place details store, creating it if needed."""
+    _DETAILS_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(_DETAILS_DB_PATH, timeout=1.0)
+    try:
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS place_details "
+            "(place_id TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB NOT NULL)"
+        )
+    except sqlite3.Error:
+        db.close()
+        raise
+    return db
+
+def _load_place_details(place_id: str) -> tuple | None:
+    """Returns the stored (etag, last_modified, body) for place_id, or None on a miss or store error."""
+    try:
+        with closing(_details_db_connection()) as db:
+            return db.execute(
+                "SELECT etag, last_modified, body FROM place_details WHERE place_id = ?", (place_id,)
+            ).fetchone()
+    except (OSError, sqlite3.Error):
+        return None
+
+def _store_place_details(place_id: str, etag: str | None, last_modified: str | None, body: bytes) -> None:
+    """Stores a place detail record, skipping it silently if the store is unavailable."""
+    try:
+        with closing(_details_db_connection()) as db, db:
+            db.execute(
+                "INSERT OR REPLACE INTO place_details VALUES (?, ?, ?, ?)",
+                (place_id, etag, last_modified, body),
+            )
+    except (OSError, sqlite3.Error):
+        pass
+
+# Caps the number of concurrent TGAZ requests issued by get_place_details_bulk
+_details_semaphore = asyncio.Semaphore(20)
+
+# TGAZ serves a static historical dataset, so responses are cached in-process
+# and repeated lookups within a session are answered without a round trip.
+# Only successful responses are cached; errors propagate to the tool.
+@alru_cache(maxsize=512, ttl=600)
+async def _fetch_historical_places(name: str, year: int = None, feature_type: str = None, parent: str = None) -> dict:
+    """
+    Fetches the full, unpaginated TGAZ search result for a query.
+
+    The result is cached independently of the requested page, so paging
+    through a result set only hits the network once. TGAZ's faceted search
+    has no paging parameters of its own, which is why pagination is done
+    client-side by search_historical_places.
+    """
+    # Build parameters for faceted search
+    params = {"fmt": "json", "n": name}
+    
+    if year is not None:
+        params["yr"] = year
+    if feature_type is not None:
+        params["ftyp"] = feature_type
+    if parent is not None:
+        params["p"] = parent
+    
+    response = await get_with_retry("http://tgaz.fudan.edu.cn/tgaz/placename", params=params)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+@alru_cache(maxsize=1024, ttl=3600)
+async def _fetch_place_details(place_id: str) -> dict:
+    """Fetches the TGAZ record for a fully prefixed place ID (e.g. 'hvd_80547')."""
+    cached = await asyncio.to_thread(_load_place_details, place_id)
+    headers = {}
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = await get_with_retry(f"http://tgaz.fudan.edu.cn/tgaz/placename/json/{place_id}", headers=headers)
+    if cached is not None and response.status_code == 304:
+        return orjson.loads(cached[2])
+    response.raise_for_status()
+    place_data = orjson.loads(response.content)
+
+    # Without a validator the record could never be revalidated, so it is not stored
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        await asyncio.to_thread(_store_place_details, place_id, etag, last_modified, response.content)
+    return place_data
+
+async def search_historical_places(name: str, year: int = None, feature_type: str = None, parent: str = None, start: int = 1, list_length: int = 10) -> dict:
+    """
+    Searches for historical place names in the TGAZ (Temporal Gazetteer) database.
+
+    Args:
+        name (str): The place name to search for. Can be provided in various languages including 
+                    Chinese, Pinyin, Tibetan, or Russian.
+        year (int, optional): Year of existence filter (valid years for Chinese records: -222 to 1911).
+        feature_type (str, optional): Feature type/class of placename (e.g., 'xian', 'zhou', 'cun zhen').
+        parent (str, optional): The immediate parent jurisdiction where the place was located.
+        start (int): Pagination start index. Defaults to 1.
+        list_length (int): Number of results per page. Defaults to 10.
+
+    Returns:
+        dict: A dictionary containing:
+            - system: Information about the data source system
+            - memo: Description of the search query
+            - count of displayed results: Number of results shown
+            - count of total results: Total number of matching records
+            - placenames: List of dictionaries with place information including:
+                - sys_id: Unique identifier for the place
+                - uri: URI for accessing detailed place information
+                - name: Place name
+                - transcription: Romanized transcription of the name
+                - years: Time period when the place existed
+                - parent sys_id: ID of the parent administrative unit
+                - parent name: Name of the parent administrative unit
+                - feature type: Type of administrative or geographic feature
+                - object type: Spatial representation type (POINT or POLYGON)
+                - xy coordinates: Geographical coordinates
+                - data source: Origin of the data
+
+    Example Usage:
+        To search for places named "平江府":
+        search_historical_places(name="平江府")
+        
+        To search for places with "龍" that existed around 800 CE:
+        search_historical_places(name="龍", year=800)
+        
+        To search for "xian" feature types with name containing "庆" in year 1420:
+        search_historical_places(name="庆", feature_type="xian", year=1420, parent="Chuzhou")
+    """
+    try:
+        # Copy the cached response so that paginating does not modify it
+        results = dict(await _fetch_historical_places(name, year, feature_type, parent))
+        
+        # Check if we have results and perform client-side pagination if needed
+        if "placenames" in results and results["placenames"]:
+            placenames = results["placenames"]
+            total = len(placenames)
+            # Apply pagination (client-side)
+            end = min(start - 1 + list_length, total)
+            paginated_results = placenames[start-1:end] if start <= total else []
+            
+            # Update the response with paginated results
+            results["placenames"] = paginated_results
+            results["count of displayed results"] = str(len(paginated_results))
+            
+            # Add pagination info to the response
+            results["pagination"] = {
+                "start": start,
+                "end": end if paginated_results else start,
+                "total_pages": -(-total // list_length)
+            }
+        
+        return results
+        
+    except httpx.RequestError as exc:
+        return {"error": f"API request failed: {exc}"}
+    except httpx.HTTPStatusError as exc:
+        return {"error": "http_error", "status": exc.response.status_code, "body": exc.response.text[:500]}
+    except Exception as e:
+        return {"error": f"An unexpected error occurred: {e}"}
+
+async def get_place_details(place_id: str) -> dict:
+    """
+    Retrieves detailed information about a specific historical place by its ID.
+    
+    Args:
+        place_id (str): The unique identifier of the place (e.g., 'hvd_80547')
+        
+    Returns:
+        dict: Detailed information about the historical place including:
+            - system: Data source information
+            - license: License information for the data
+            - uri: URI reference for the place
+            - sys_id: Unique identifier for the place
+            - spellings: List of different written forms and transcriptions
+            - feature_type: Administrative unit type information
+            - temporal: Time period information (begin/end years)
+            - spatial: Geographic location information
+            - historical_context: Information about parent jurisdictions, subordinate units, etc.
+            - data source: Origin database of the record
+            - source note: Detailed historical notes and citations
+        
+    Example Usage:
+        To get details for place with ID 'hvd_80547' (腾冲府/Tengchong Fu):
+        get_place_details(place_id="hvd_80547")
+    """
+    # The ID should already include the 'hvd_' prefix
+    if place_id[:4] != "hvd_":
+        place_id = "hvd_" + place_id
+    
+    try:
+        place_data = await _fetch_place_details(place_id)
+        
+        # Handle any potential parsing issues with source_note
+        if "source note" in place_data and isinstance(place_data["source note"], str):
+            # In some cases, the source note might be an incomplete or malformed JSON string
+            # We'll keep it as is, but ensure it doesn't cause issues
+            pass
+            
+        return place_data
+        
+    except httpx.RequestError as exc:
+        return {"error": f"API request failed: {exc}"}
+    except httpx.HTTPStatusError as exc:
+        return {"error": "http_error", "status": exc.response.status_code, "body": exc.response.text[:500]}
+    except ValueError as exc:
+        # This might happen if the JSON parsing fails
+        return {"error": f"Invalid response format: {exc}"}
+    except Exception as e:
+        return {"error": f"An unexpected error occurred: {e}"}
+
+async def get_place_details_bulk(place_ids: list[str]) -> list[dict]:
+    """
+    Retrieves detailed information about several historical places at once.
+
+    The places are fetched concurrently, so this is much faster than calling
+    get_place_details once per place. A failure for one place does not affect
+    the others.
+
+    Args:
+        place_ids (list[str]): The unique identifiers of the places (e.g., ['hvd_80547'])
+
+    Returns:
+        list[dict]: One entry per place ID, in the same order as place_ids. Each entry has the
+            same format as the result of get_place_details, or an "error" key (together with
+            the "place_id") if the place could not be retrieved.
+
+    Example Usage:
+        To get details for every place returned by search_historical_places:
+        get_place_details_bulk(place_ids=[place["sys_id"] for place in results["placenames"]])
+    """
+    async def fetch(place_id: str) -> dict:
+        async with _details_semaphore:
+            result = await get_place_details(place_id)
+        # Tag errors with the place they belong to
+        if "error" in result:
+            result = {**result, "place_id": place_id}
+        return result
+
+    results = await asyncio.gather(*(fetch(place_id) for place_id in place_ids), return_exceptions=True)
+    return [
+        {"error": f"An unexpected error occurred: {result!r}", "place_id": place_id}
+        if isinstance(result, BaseException) else result
+        for place_id, result in zip(place_ids, results)
+    ]